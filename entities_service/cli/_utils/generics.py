@@ -94,10 +94,16 @@ def print(
 ) -> None:
     """Print to the output console."""
     file = file or OUTPUT_CONSOLE.file
-    kwargs = {"sep": sep, "end": end, "file": file, "flush": flush}
-    for key, value in list(kwargs.items()):
-        if value is None:
-            del kwargs[key]
+    kwargs = {
+        key: value
+        for key, value in (
+            ("sep", sep),
+            ("end", end),
+            ("file", file),
+            ("flush", flush),
+        )
+        if value is not None
+    }
 
     rich_print(*objects, **kwargs)
 
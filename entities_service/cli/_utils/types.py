@@ -38,6 +38,13 @@ class EntityFileFormats(StrEnum):
     YML = "yml"
 
 
+class OutputFormat(StrEnum):
+    """Supported CLI output formats."""
+
+    RICH = "rich"
+    JSON = "json"
+
+
 class StrReversor(str):
     """Utility class to reverse the comparison of strings.
 
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 from collections.abc import Generator
-from functools import cache
 from typing import Annotated, get_args
 
 try:
@@ -21,6 +20,11 @@ from entities_service.cli._utils.global_settings import CONTEXT
 from entities_service.cli._utils.types import OptionalStr, StrEnum
 from entities_service.service.config import CONFIG
 
+# The environment variable prefix for configuration options, e.g.,
+# 'entities_service_'. Resolved once at import time, since it is used repeatedly
+# throughout this module.
+ENV_PREFIX = CONFIG.model_config["env_prefix"]
+
 APP = typer.Typer(
     name=__file__.rsplit("/", 1)[-1].replace(".py", ""),
     help="Manage configuration options.",
@@ -56,35 +60,52 @@ class ConfigFields(StrEnum):
                 yield member.value, CONFIG.model_fields[member.value].description
 
     @classmethod
-    @cache
     def sensitive_fields(cls) -> dict[ConfigFields, bool]:  # type: ignore[valid-type]
         """Return a mapping of sensitive configuration options."""
-        sensitive_fields: dict[ConfigFields, bool] = {}
-        for config_name, field_info in CONFIG.model_fields.items():
-            annotation = field_info.rebuild_annotation()
+        return _SENSITIVE_FIELDS
+
+    def is_sensitive(self) -> bool:
+        """Return True if this is a sensitive configuration option."""
+        return self in _SENSITIVE_FIELDS_SET
 
-            annotation_args = get_args(annotation)
 
-            if annotation_args:
-                if any(_ in (SecretStr, SecretBytes) for _ in annotation_args):
-                    sensitive_fields[getattr(cls, config_name.upper())] = True
-                else:
-                    sensitive_fields[getattr(cls, config_name.upper())] = False
+def _build_sensitive_fields() -> dict[ConfigFields, bool]:
+    """Build the mapping of sensitive configuration options.
 
-            elif annotation in (SecretStr, SecretBytes):  # pragma: no cover
-                # Currently there is no config value that fits this test.
-                # But we keep it here to be future-proof and more clear about the usage
-                # of `typing.get-args()`.
-                sensitive_fields[getattr(cls, config_name.upper())] = True
+    Materialized at import time, so the reflection cost of walking
+    `CONFIG.model_fields` is not paid on the first `is_sensitive()` call.
+    """
+    sensitive_fields: dict[ConfigFields, bool] = {}
+    for config_name, field_info in CONFIG.model_fields.items():
+        annotation = field_info.rebuild_annotation()
 
+        annotation_args = get_args(annotation)
+
+        if annotation_args:
+            if any(_ in (SecretStr, SecretBytes) for _ in annotation_args):
+                sensitive_fields[getattr(ConfigFields, config_name.upper())] = True
             else:
-                sensitive_fields[getattr(cls, config_name.upper())] = False
+                sensitive_fields[getattr(ConfigFields, config_name.upper())] = False
 
-        return sensitive_fields
+        elif annotation in (SecretStr, SecretBytes):  # pragma: no cover
+            # Currently there is no config value that fits this test.
+            # But we keep it here to be future-proof and more clear about the usage
+            # of `typing.get-args()`.
+            sensitive_fields[getattr(ConfigFields, config_name.upper())] = True
 
-    def is_sensitive(self) -> bool:
-        """Return True if this is a sensitive configuration option."""
-        return self.__class__.sensitive_fields()[self]
+        else:
+            sensitive_fields[getattr(ConfigFields, config_name.upper())] = False
+
+    return sensitive_fields
+
+
+_SENSITIVE_FIELDS = _build_sensitive_fields()
+"""Mapping of all configuration options to their sensitivity."""
+
+_SENSITIVE_FIELDS_SET = frozenset(
+    config_field for config_field, sensitive in _SENSITIVE_FIELDS.items() if sensitive
+)
+"""The sensitive-only configuration options, for fast membership testing."""
 
 
 @APP.command(name="set")
@@ -95,7 +116,7 @@ def set_config(
             help=(
                 "Configuration option to set. These can also be set as an environment "
                 "variable by prefixing with "
-                f"{CONFIG.model_config['env_prefix'].upper()!r}."
+                f"{ENV_PREFIX.upper()!r}."
             ),
             show_choices=True,
             autocompletion=ConfigFields.autocomplete,
@@ -130,15 +151,12 @@ def set_config(
     if not dotenv_file.exists():
         dotenv_file.touch()
 
-    set_key(dotenv_file, f"{CONFIG.model_config['env_prefix']}{key}".upper(), value)
+    set_key(dotenv_file, f"{ENV_PREFIX}{key}".upper(), value)
 
     print(
-        (
-            f"Set {CONFIG.model_config['env_prefix'].upper()}{key.upper()} to "
-            "sensitive value."
-        )
+        f"Set {ENV_PREFIX.upper()}{key.upper()} to sensitive value."
         if key.is_sensitive()
-        else f"Set {CONFIG.model_config['env_prefix'].upper()}{key.upper()} to {value}."
+        else f"Set {ENV_PREFIX.upper()}{key.upper()} to {value}."
     )
 
 
@@ -158,14 +176,13 @@ def show(
 
     if dotenv_file.exists():
         print(f"Current configuration in {dotenv_file}:\n")
+        valid_env_keys = frozenset(
+            f"{ENV_PREFIX}{_}".upper() for _ in ConfigFields.__members__.values()
+        )
         values: dict[ConfigFields, str | None] = {
-            ConfigFields(key[len(CONFIG.model_config["env_prefix"]) :].lower()): value
+            ConfigFields(key[len(ENV_PREFIX) :].lower()): value
             for key, value in dotenv_values(dotenv_file).items()
-            if key
-            in [
-                f"{CONFIG.model_config['env_prefix']}{_}".upper()
-                for _ in ConfigFields.__members__.values()
-            ]
+            if key in valid_env_keys
         }
     else:
         ERROR_CONSOLE.print(f"No {dotenv_file} file found.")
@@ -178,9 +195,7 @@ def show(
         if not reveal_sensitive and key.is_sensitive():
             sensitive_value = "*" * 8
 
-        output[f"{CONFIG.model_config['env_prefix']}{key}".upper()] = (
-            sensitive_value or value
-        )
+        output[f"{ENV_PREFIX}{key}".upper()] = sensitive_value or value
 
     print(
         "\n".join(
@@ -207,8 +222,8 @@ def unset(
     dotenv_file = CONTEXT["dotenv_path"]
 
     if dotenv_file.exists():
-        unset_key(dotenv_file, f"{CONFIG.model_config['env_prefix']}{key}".upper())
-        print(f"Unset {CONFIG.model_config['env_prefix'].upper()}{key.upper()}.")
+        unset_key(dotenv_file, f"{ENV_PREFIX}{key}".upper())
+        print(f"Unset {ENV_PREFIX.upper()}{key.upper()}.")
     else:
         print(f"{dotenv_file} file not found.")
 
@@ -68,7 +68,7 @@ def entities(
         namespace = valid_namespaces
 
     if namespace is None:
-        namespace = [str(CONFIG.base_url).rstrip("/")] if valid_namespaces else []
+        namespace = [_core_namespace()] if valid_namespaces else []
 
     try:
         target_namespaces = [_parse_namespace(ns) for ns in namespace]
@@ -188,7 +188,7 @@ def entities(
 
         last_namespace, last_name = entity_namespace, entity_name
 
-    core_namespace = str(CONFIG.base_url).rstrip("/")
+    core_namespace = _core_namespace()
     single_namespace = ""
     if len(target_namespaces) == 1 and entity_namespace != core_namespace:
         single_namespace = f"Specific namespace: {core_namespace}/{entity_namespace}\n"
@@ -287,6 +287,15 @@ def namespaces(
     return None
 
 
+def _core_namespace() -> str:
+    """Return the core namespace, as given by the `base_url` configuration setting.
+
+    Resolved at call time (rather than hoisted to a module constant), since tests
+    patch `CONFIG.base_url` on this module.
+    """
+    return str(CONFIG.base_url).rstrip("/")
+
+
 def _parse_namespace(namespace: str | None, allow_external: bool = True) -> str:
     """Parse a (specific) namespace, returning a full namespace."""
     # If a full URI (including version and name) is passed,
@@ -297,7 +306,7 @@ def _parse_namespace(namespace: str | None, allow_external: bool = True) -> str:
     ):
         return match.group("namespace")
 
-    core_namespace = str(CONFIG.base_url).rstrip("/")
+    core_namespace = _core_namespace()
 
     if namespace is None or (
         isinstance(namespace, str) and namespace.strip() in ("/", "")
@@ -331,8 +340,10 @@ def _get_specific_namespace(namespace: str) -> str | None:
 
     If the namespace is the core namespace, return `None`.
     """
-    if namespace.startswith(str(CONFIG.base_url).rstrip("/")):
-        namespace = namespace[len(str(CONFIG.base_url).rstrip("/")) :]
+    core_namespace = _core_namespace()
+
+    if namespace.startswith(core_namespace):
+        namespace = namespace[len(core_namespace) :]
 
     if namespace.strip() in ("/", ""):
         return None
@@ -29,6 +29,7 @@ from entities_service.cli._utils.types import (
     EntityFileFormats,
     OptionalListEntityFileFormats,
     OptionalListPath,
+    OutputFormat,
 )
 from entities_service.cli.commands.login import login
 from entities_service.cli.commands.validate import validate
@@ -45,6 +46,9 @@ if TYPE_CHECKING:  # pragma: no cover
 
     from entities_service.cli._utils.types import ValidEntity
 
+# Compiled once at import time - matches a simple MAJOR(.MINOR(.PATCH)) version
+SOFT_VERSION_REGEX = re.compile(r"^\d+(?:\.\d+){0,2}$")
+
 
 def upload(
     sources: Annotated[
@@ -157,6 +161,19 @@ def upload(
             show_default=True,
         ),
     ] = False,
+    output_format: Annotated[
+        OutputFormat,
+        typer.Option(
+            "--output-format",
+            help=(
+                "Output format for the upload summary. 'json' emits a single "
+                "machine-readable JSON line (also when '--quiet' is provided)."
+            ),
+            show_choices=True,
+            show_default=True,
+            case_sensitive=False,
+        ),
+    ] = OutputFormat.RICH,
 ) -> None:
     """Upload (local) entities to a remote location."""
     # Ensure the user is logged in
@@ -272,7 +289,7 @@ def upload(
                     f"New version ({new_version}) is the same as the existing "
                     "version.\n"
                 )
-            elif re.match(r"^\d+(?:\.\d+){0,2}$", new_version) is None:
+            elif SOFT_VERSION_REGEX.match(new_version) is None:
                 error_message = (
                     "[bold red]Error[/bold red]: Could not update entity. "
                     f"New version ({new_version}) is not a valid SOFT version.\n"
@@ -434,11 +451,30 @@ def upload(
             )
             raise typer.Exit(1)
 
-        if not quiet:
+        if output_format == OutputFormat.JSON:
+            typer.echo(
+                json.dumps(
+                    {
+                        "uploaded": len(successes),
+                        "uris": [
+                            entity.get("uri")
+                            or (
+                                f"{entity.get('namespace', '')}"
+                                f"/{entity.get('version', '')}"
+                                f"/{entity.get('name', '')}"
+                            )
+                            for entity in successes
+                        ],
+                    }
+                )
+            )
+        elif not quiet:
             print(
                 f"[bold green]Successfully uploaded {len(successes)} "
                 f"entit{'y' if len(successes) == 1 else 'ies'}"
             )
 
+    elif output_format == OutputFormat.JSON:
+        typer.echo(json.dumps({"uploaded": 0, "uris": []}))
     elif not quiet:
         print("[bold blue]No entities were uploaded.[/bold blue]")
@@ -317,7 +317,11 @@ def validate(
         entities: list[dict[str, Any]] | dict[str, Any] = (
             json.loads(filepath.read_bytes())
             if file_format == "json"
-            else yaml.safe_load(filepath.read_bytes())
+            # Use the C-accelerated YAML loader if available
+            else yaml.load(
+                filepath.read_bytes(),
+                Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader),
+            )
         )
 
         if isinstance(entities, dict):
@@ -366,84 +370,90 @@ def validate(
 
     ## Evaluate each unique entity against its external/remote counter-part
 
-    for entity_model in unique_entities:
-        # Abort for-loop if `--no-external-calls` is provided
-        if no_external_calls:
-            if not quiet:
-                print(
-                    "[bold blue]Info[/bold blue]: No external calls will be made to "
-                    "validate the entities."
-                )
-            successes = [
-                ValidEntity(entity, None, None, None) for entity in unique_entities
-            ]
-            break
-
-        # Check if entity exists at its given URL URI
+    if no_external_calls:
+        if unique_entities and not quiet:
+            print(
+                "[bold blue]Info[/bold blue]: No external calls will be made to "
+                "validate the entities."
+            )
+        successes = [
+            ValidEntity(entity, None, None, None) for entity in unique_entities
+        ]
+    elif unique_entities:
+        # Use a single client for all remote checks - the underlying connection
+        # (pool) is then reused across entities instead of re-establishing a new
+        # connection per entity.
         with httpx.Client(follow_redirects=True, timeout=10) as client:
-            try:
-                response = client.get(get_uri(entity_model))
-            except httpx.HTTPError as exc:
-                ERROR_CONSOLE.print(
-                    "[bold red]Error[/bold red]: Could not check if entity already "
-                    f"exists. HTTP exception: {exc}"
-                )
-                raise typer.Exit(1) from exc
-
-        external_entity: dict[str, Any] | None = None
-        if response.is_success:
-            try:
-                external_entity = response.json()
-            except json.JSONDecodeError as exc:
-                ERROR_CONSOLE.print(
-                    "[bold red]Error[/bold red]: Could not check if entity already "
-                    f"exists. JSON decode error: {exc}"
-                )
-                raise typer.Exit(1) from exc
-
-        if external_entity is None:
-            # Entity does not exist externally/remotely
-            successes.append(ValidEntity(entity_model, False, None, None))
-            continue
+            for entity_model in unique_entities:
+                # Check if entity exists at its given URL URI
+                try:
+                    response = client.get(get_uri(entity_model))
+                except httpx.HTTPError as exc:
+                    ERROR_CONSOLE.print(
+                        "[bold red]Error[/bold red]: Could not check if entity already "
+                        f"exists. HTTP exception: {exc}"
+                    )
+                    raise typer.Exit(1) from exc
 
-        ## Compare external/remote model with local model
+                external_entity: dict[str, Any] | None = None
+                if response.is_success:
+                    try:
+                        external_entity = response.json()
+                    except json.JSONDecodeError as exc:
+                        ERROR_CONSOLE.print(
+                            "[bold red]Error[/bold red]: Could not check if entity "
+                            f"already exists. JSON decode error: {exc}"
+                        )
+                        raise typer.Exit(1) from exc
 
-        # Dump local entity to match the format of the external entity
-        dumped_entity = entity_model.model_dump(
-            by_alias=True, mode="json", exclude_unset=True
-        )
+                if external_entity is None:
+                    # Entity does not exist externally/remotely
+                    successes.append(ValidEntity(entity_model, False, None, None))
+                    continue
 
-        if external_entity == dumped_entity:
-            successes.append(ValidEntity(entity_model, True, True, None))
-        else:
-            # Record the differences between the external and local entities
-            pretty_diff = pretty_compare_dicts(external_entity, dumped_entity)
-            successes.append(ValidEntity(entity_model, True, False, pretty_diff))
+                ## Compare external/remote model with local model
 
-            if strict:
-                ERROR_CONSOLE.print(
-                    f"[bold red]Error[/bold red]: Entity {get_uri(entity_model)} "
-                    "already exists externally and differs in its contents."
+                # Dump local entity to match the format of the external entity
+                dumped_entity = entity_model.model_dump(
+                    by_alias=True, mode="json", exclude_unset=True
                 )
 
-                if fail_fast:
-                    if verbose:
-                        ERROR_CONSOLE.print(
-                            "\n[bold blue]Detailed differences:[/bold blue]"
-                        )
-                        ERROR_CONSOLE.print(
-                            "", Rule(title=get_uri(entity_model)), f"\n{pretty_diff}\n"
-                        )
-                    elif not quiet and not return_full_info:
+                if external_entity == dumped_entity:
+                    successes.append(ValidEntity(entity_model, True, True, None))
+                else:
+                    # Record the differences between the external and local entities
+                    pretty_diff = pretty_compare_dicts(external_entity, dumped_entity)
+                    successes.append(
+                        ValidEntity(entity_model, True, False, pretty_diff)
+                    )
+
+                    if strict:
                         ERROR_CONSOLE.print(
-                            "\n[bold blue]Use the option '--verbose' to see the "
-                            "difference between the external and local entity."
-                            "[/bold blue]\n"
+                            f"[bold red]Error[/bold red]: Entity "
+                            f"{get_uri(entity_model)} already exists externally and "
+                            "differs in its contents."
                         )
 
-                    raise typer.Exit(1)
-
-                failed_entities.append(get_uri(entity_model))
+                        if fail_fast:
+                            if verbose:
+                                ERROR_CONSOLE.print(
+                                    "\n[bold blue]Detailed differences:[/bold blue]"
+                                )
+                                ERROR_CONSOLE.print(
+                                    "",
+                                    Rule(title=get_uri(entity_model)),
+                                    f"\n{pretty_diff}\n",
+                                )
+                            elif not quiet and not return_full_info:
+                                ERROR_CONSOLE.print(
+                                    "\n[bold blue]Use the option '--verbose' to see "
+                                    "the difference between the external and local "
+                                    "entity.[/bold blue]\n"
+                                )
+
+                            raise typer.Exit(1)
+
+                        failed_entities.append(get_uri(entity_model))
 
     ## Report the results
 
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 from pathlib import Path as sysPath
 from typing import TYPE_CHECKING, Annotated
 
-from fastapi import FastAPI, HTTPException, Path, status
+from fastapi import FastAPI, Path, Response, status
+from fastapi.responses import ORJSONResponse
 
 from entities_service import __version__
 from entities_service.models import (
@@ -16,18 +18,33 @@ from entities_service.models import (
     EntityVersionType,
 )
 from entities_service.service.backend import get_backend
+from entities_service.service.backend.backend import EntityNotFound
 from entities_service.service.config import CONFIG
 from entities_service.service.logger import setup_logger
 from entities_service.service.routers import get_routers
 from entities_service.service.utils import _get_entity
 
 if TYPE_CHECKING:  # pragma: no cover
-    from typing import Any
+    from fastapi import Request
 
 
 LOGGER = logging.getLogger("entities_service")
 
 
+# Read the service description (the repository README) once at import time.
+# The README may not be included in all installs (e.g., bare wheel installs), in
+# which case the description is simply left empty.
+try:
+    _DESCRIPTION = (
+        sysPath(__file__).resolve().parent.parent.resolve() / "README.md"
+    ).read_text(encoding="utf8")
+except FileNotFoundError:  # pragma: no cover
+    _DESCRIPTION = ""
+
+_ROOT_PATH = CONFIG.base_url.path if CONFIG.base_url.path != "/" else ""
+"""The application root path, derived from the configured base URL."""
+
+
 # Application lifespan function
 @asynccontextmanager
 async def lifespan(_: FastAPI):
@@ -38,7 +55,13 @@ async def lifespan(_: FastAPI):
     LOGGER.debug("Starting service with config: %s", CONFIG)
 
     # Initialize backend with core namespace
-    get_backend(CONFIG.backend, auth_level="write")
+    # Backend creation is blocking I/O (client and TLS setup) - run it in a
+    # thread, keeping the event loop responsive during startup.
+    await asyncio.to_thread(get_backend, CONFIG.backend, "write")
+
+    # Warm up the (cached) read backend as well, so the first read request does
+    # not pay for settings validation and client/collection resolution.
+    await asyncio.to_thread(get_backend, CONFIG.backend, "read")
 
     # Run application
     yield
@@ -48,11 +71,10 @@ async def lifespan(_: FastAPI):
 APP = FastAPI(
     title="Entities Service",
     version=__version__,
-    description=(
-        sysPath(__file__).resolve().parent.parent.resolve() / "README.md"
-    ).read_text(encoding="utf8"),
+    description=_DESCRIPTION,
     lifespan=lifespan,
-    root_path=CONFIG.base_url.path if CONFIG.base_url.path != "/" else "",
+    root_path=_ROOT_PATH,
+    default_response_class=ORJSONResponse,
 )
 
 # Add routers
@@ -60,32 +82,41 @@ for router in get_routers():
     APP.include_router(router)
 
 
+@APP.exception_handler(EntityNotFound)
+async def entity_not_found_handler(_: Request, exc: EntityNotFound) -> ORJSONResponse:
+    """Convert a backend-raised `EntityNotFound` to a Not Found (404) response.
+
+    A single handler replaces per-endpoint try/except blocks around entity
+    retrieval.
+    """
+    return ORJSONResponse({"detail": str(exc)}, status_code=status.HTTP_404_NOT_FOUND)
+
+
+def _serialize_entity(content: bytes) -> Response:
+    """Wrap a pre-encoded entity (as returned by `_get_entity`) in a response.
+
+    The content is already JSON-encoded - returning it directly avoids
+    re-serializing on every request.
+    """
+    return Response(content=content, media_type="application/json")
+
+
 @APP.get(
     "/{version}/{name}",
-    response_model=Entity,
-    response_model_by_alias=True,
-    response_model_exclude_unset=True,
+    responses={200: {"model": Entity}},
     tags=["Entities"],
 )
 async def get_core_namespace_entity(
     version: Annotated[EntityVersionType, Path(title="Entity version")],
     name: Annotated[EntityNameType, Path(title="Entity name")],
-) -> dict[str, Any]:
+) -> Response:
     """Get an entity from the core namespace."""
-    try:
-        return await _get_entity(version=version, name=name)
-    except ValueError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(exc),
-        ) from exc
+    return _serialize_entity(await _get_entity(version=version, name=name))
 
 
 @APP.get(
     "/{specific_namespace:path}/{version}/{name}",
-    response_model=Entity,
-    response_model_by_alias=True,
-    response_model_exclude_unset=True,
+    responses={200: {"model": Entity}},
     tags=["Entities"],
 )
 async def get_specific_namespace_entity(
@@ -98,12 +129,8 @@ async def get_specific_namespace_entity(
     ],
     version: Annotated[EntityVersionType, Path(title="Entity version")],
     name: Annotated[EntityNameType, Path(title="Entity name")],
-) -> dict[str, Any]:
+) -> Response:
     """Get an entity from a specific namespace."""
-    try:
-        return await _get_entity(version=version, name=name, db=specific_namespace)
-    except ValueError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(exc),
-        ) from exc
+    return _serialize_entity(
+        await _get_entity(version=version, name=name, db=specific_namespace)
+    )
@@ -9,6 +9,7 @@ from pydantic import ValidationError
 from .dlite_soft5 import DLiteSOFT5Entity
 from .dlite_soft7 import DLiteSOFT7Entity
 from .soft import (
+    BASE_URL,
     GENERIC_NAMESPACE_URI_REGEX,
     NO_GROUPS_SEMVER_REGEX,
     SEMVER_REGEX,
@@ -27,6 +28,7 @@ Entity = SOFT7Entity | SOFT5Entity | DLiteSOFT7Entity | DLiteSOFT5Entity
 EntityType = get_args(Entity)
 
 __all__ = (
+    "BASE_URL",
     "GENERIC_NAMESPACE_URI_REGEX",
     "NO_GROUPS_SEMVER_REGEX",
     "SEMVER_REGEX",
@@ -43,6 +45,41 @@ __all__ = (
 )
 
 
+def _predict_entity_cls(fields: dict) -> type[Entity] | None:
+    """Predict the entity class for the given fields, based on cheap dict inspection.
+
+    SOFT5 and SOFT7 are distinguished by `properties` being a list or a dict,
+    respectively. The DLite variants are distinguished by the presence of a `meta`
+    key or a `$ref`/`ref` key in any of the properties - keys the plain SOFT models
+    forbid (`extra="forbid"`), so the prediction always agrees with trying the
+    classes in the `Entity` union order.
+
+    Return `None` if no prediction can be made.
+    """
+    properties = fields.get("properties")
+
+    soft_cls: type[Entity]
+    dlite_cls: type[Entity]
+
+    if isinstance(properties, dict):
+        property_values = list(properties.values())
+        soft_cls, dlite_cls = SOFT7Entity, DLiteSOFT7Entity
+    elif isinstance(properties, list):
+        property_values = properties
+        soft_cls, dlite_cls = SOFT5Entity, DLiteSOFT5Entity
+    else:
+        return None
+
+    if "meta" in fields or any(
+        isinstance(property_value, dict)
+        and ("$ref" in property_value or "ref" in property_value)
+        for property_value in property_values
+    ):
+        return dlite_cls
+
+    return soft_cls
+
+
 @overload
 def soft_entity(
     *, return_errors: Literal[False] = False, error_msg: str | None = None, **fields
@@ -59,6 +96,16 @@ def soft_entity(
 
 def soft_entity(*, return_errors: bool = False, error_msg: str | None = None, **fields):
     """Return the correct version of the SOFT Entity."""
+    # Fast path: try the predicted entity class first, avoiding the cost of failed
+    # validation passes for the other classes in the union.
+    if (predicted_entity_cls := _predict_entity_cls(fields)) is not None:
+        try:
+            return predicted_entity_cls(**fields)
+        except ValidationError:
+            # Fall back to trying all classes in the union (in order), so the
+            # errors reported below always cover the full union.
+            pass
+
     errors = []
     for versioned_entity_cls in get_args(Entity):
         try:
@@ -112,27 +159,38 @@ def get_updated_version(entity: Entity) -> str:
     #  - MAJOR
     #  - MAJOR.MINOR
     #  - MAJOR.MINOR.PATCH
-    split_version = current_version.split(".")
+    # Locate the (up to two) dots directly, avoiding a split-list allocation.
+    first_dot = current_version.find(".")
 
-    # Check we are dealing with integers in split_version
-    if not all(version_part.isnumeric() for version_part in split_version):
-        raise ValueError(error_message)
+    # If version is just MAJOR, add and increment MINOR by 1
+    if first_dot == -1:
+        if not current_version.isnumeric():
+            raise ValueError(error_message)
 
-    major_length = 1
-    minor_length = 2
-    patch_length = 3
+        return f"{current_version}.1"
 
-    # If version is just MAJOR, add and increment MINOR by 1
-    # If version is MAJOR.MINOR, add and increment PATCH by 1
-    # If version is MAJOR.MINOR.PATCH, increment PATCH by 1
+    second_dot = current_version.find(".", first_dot + 1)
 
-    if len(split_version) == major_length:
-        return f"{split_version[0]}.1"
+    # If version is MAJOR.MINOR, add and increment PATCH by 1
+    if second_dot == -1:
+        if not (
+            current_version[:first_dot].isnumeric()
+            and current_version[first_dot + 1 :].isnumeric()
+        ):
+            raise ValueError(error_message)
 
-    if len(split_version) == minor_length:
-        return f"{split_version[0]}.{split_version[1]}.1"
+        return f"{current_version}.1"
 
-    if len(split_version) == patch_length:
-        return f"{split_version[0]}.{split_version[1]}.{int(split_version[2]) + 1}"
+    # If version is MAJOR.MINOR.PATCH, increment PATCH by 1
+    # Note, a PATCH part containing further dots (e.g., MAJOR.MINOR.PATCH.X) is not
+    # numeric and is rejected here.
+    patch = current_version[second_dot + 1 :]
+
+    if not (
+        current_version[:first_dot].isnumeric()
+        and current_version[first_dot + 1 : second_dot].isnumeric()
+        and patch.isnumeric()
+    ):
+        raise ValueError(error_message)
 
-    raise ValueError(error_message)
+    return f"{current_version[: second_dot + 1]}{int(patch) + 1}"
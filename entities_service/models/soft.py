@@ -22,6 +22,13 @@ from pydantic.networks import AnyHttpUrl
 
 from entities_service.service.config import CONFIG
 
+BASE_URL = str(CONFIG.base_url).rstrip("/")
+"""The service base URL without a trailing slash, e.g., 'http://onto-ns.com/meta'.
+
+Resolved once at import time - stringifying the pydantic URL on every use is
+comparatively expensive.
+"""
+
 SEMVER_REGEX = (
     r"(?P<major>0|[1-9]\d*)(?:\.(?P<minor>0|[1-9]\d*))?(?:\.(?P<patch>0|[1-9]\d*))?"
     r"(?:-(?P<prerelease>(?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*)"
@@ -49,7 +56,7 @@ This is the same as `SEMVER_REGEX`, but without the named groups.
 """
 
 URI_REGEX = re.compile(
-    rf"^(?P<namespace>{re.escape(str(CONFIG.base_url).rstrip('/'))}(?:/(?P<specific_namespace>.+))?)"
+    rf"^(?P<namespace>{re.escape(BASE_URL)}(?:/(?P<specific_namespace>.+))?)"
     rf"/(?P<version>{NO_GROUPS_SEMVER_REGEX})/(?P<name>[^/#?]+)$"
 )
 """Regular expression to parse a SOFT entity URI as URL."""
@@ -73,7 +80,7 @@ def _disallowed_namespace_characters(value: str) -> str:
     """
     base_error_message = "Invalid specific namespace -"
 
-    if not value.startswith(str(CONFIG.base_url).rstrip("/")):
+    if not value.startswith(BASE_URL):
         raise ValueError(
             f"{base_error_message} must start with the base URL of the service "
             f"({CONFIG.base_url})."
@@ -241,41 +248,34 @@ class SOFTEntity(BaseModel):
     @classmethod
     def _check_cross_dependent_fields(cls, data: Any) -> Any:
         """Check that `name`, `version`, and `namespace` are all set or all unset."""
-        if (
-            isinstance(data, dict)
-            and any(data.get(_) is None for _ in ("name", "version", "namespace"))
-            and not all(data.get(_) is None for _ in ("name", "version", "namespace"))
-        ):
+        if not isinstance(data, dict):
+            return data
+
+        # Look up each field once - this validator runs for every entity
+        name = data.get("name")
+        version = data.get("version")
+        namespace = data.get("namespace")
+        uri = data.get("uri", data.get("identity"))
+
+        any_unset = name is None or version is None or namespace is None
+        all_unset = name is None and version is None and namespace is None
+
+        if any_unset and not all_unset:
             error_message = (
                 "Either all of `name`, `version`, and `namespace` must be set "
                 "or all must be unset.\n"
             )
             raise ValueError(error_message)
 
-        if (
-            isinstance(data, dict)
-            and any(data.get(_) is None for _ in ("name", "version", "namespace"))
-            and data.get("uri", data.get("identity")) is None
-        ):
+        if any_unset and uri is None:
             error_message = (
                 "Either `name`, `version`, and `namespace` or `uri` must be set.\n"
             )
             raise ValueError(error_message)
 
-        if (
-            isinstance(data, dict)
-            and all(data.get(_) is not None for _ in ("name", "version", "namespace"))
-            and data.get("uri", data.get("identity")) is not None
-            and data.get("uri", data.get("identity", ""))
-            != f"{data['namespace']}/{data['version']}/{data['name']}"
-        ):
+        if not any_unset and uri is not None and uri != f"{namespace}/{version}/{name}":
             # Ensure that `uri` is consistent with `name`, `version`, and `namespace`.
-            diff = "\n  ".join(
-                difflib.ndiff(
-                    [data.get("uri", data.get("identity", ""))],
-                    [f"{data['namespace']}/{data['version']}/{data['name']}"],
-                )
-            )
+            diff = "\n  ".join(difflib.ndiff([uri], [f"{namespace}/{version}/{name}"]))
             error_message = (
                 "The `uri` is not consistent with `name`, `version`, and "
                 f"`namespace`:\n\n  {diff}\n\n"
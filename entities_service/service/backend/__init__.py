@@ -26,6 +26,19 @@ if TYPE_CHECKING:  # pragma: no cover
     from entities_service.service.backend.backend import Backend
 
 
+BACKEND_INSTANCES: dict[tuple[Backends, Literal["read", "write"], str | None], Backend]
+BACKEND_INSTANCES = {}
+"""Global cache for backend instances.
+
+The key is a tuple of the backend, auth level, and db (namespace).
+
+Only backends created from the service configuration (i.e., without custom
+settings) are cached - they are effectively singletons per (backend, auth level,
+db) and wrap a long-lived MongoDB client, so there is no reason to re-create
+them per request.
+"""
+
+
 class Backends(StrEnum):
     """Backends."""
 
@@ -108,6 +121,11 @@ def get_backend(
             + "\n".join(f" - {_}" for _ in Backends.__members__.values())
         ) from exc
 
+    # Get cached backend instance (custom settings always create a new instance)
+    cache_key = (backend, auth_level, db)
+    if settings is None and cache_key in BACKEND_INSTANCES:
+        return BACKEND_INSTANCES[cache_key]
+
     backend_class = backend.get_class()
 
     # Get the settings
@@ -119,7 +137,12 @@ def get_backend(
     if settings is not None:
         backend_settings.update(settings)
 
-    return backend_class(settings=backend_settings)
+    backend_instance = backend_class(settings=backend_settings)
+
+    if settings is None:
+        BACKEND_INSTANCES[cache_key] = backend_instance
+
+    return backend_instance
 
 
 def get_dbs(backend: Backend | Backends | str | None = None) -> list[str]:
@@ -5,28 +5,33 @@ from __future__ import annotations
 import logging
 from abc import ABC, abstractmethod
 from collections.abc import Sequence
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 from entities_service.models import (
+    Entity,
     EntityType,
     get_uri,
     soft_entity,
 )
 
 if TYPE_CHECKING:  # pragma: no cover
-    from collections.abc import Iterator
+    from collections.abc import Callable, Iterator
     from typing import Any
 
     from pydantic import AnyHttpUrl
-
-    from entities_service.models import Entity
+    from pydantic.plugin._schema_validator import PluggableSchemaValidator
+    from pydantic_core import SchemaValidator
 
 
 LOGGER = logging.getLogger(__name__)
 
 
+ENTITIES_ADAPTER: TypeAdapter[list[Entity]] = TypeAdapter(list[Entity])
+"""Adapter for validating a list of entities in a single pydantic-core call."""
+
+
 # Exceptions
 class BackendError(Exception):
     """Any backend error exception."""
@@ -40,6 +45,10 @@ class MalformedResource(BackendError):
     """Exception raised when a resource is malformed."""
 
 
+class EntityNotFound(BackendError):
+    """Exception raised when an entity cannot be found in the backend."""
+
+
 # Data models
 class BackendSettings(BaseModel):
     """Settings for the backend."""
@@ -49,17 +58,41 @@ class BackendSettings(BaseModel):
 class Backend(ABC):
     """Interface/ABC for a backend."""
 
+    # Backends are instantiated per request - a slotted layout keeps them compact
+    # and avoids a per-instance `__dict__`.
+    __slots__ = ("_is_closed", "_settings")
+
     _settings_model: type[BackendSettings] = BackendSettings
     _settings: BackendSettings
 
+    _settings_validator: ClassVar[SchemaValidator | PluggableSchemaValidator] = (
+        BackendSettings.__pydantic_validator__
+    )
+    """The pydantic-core validator for `_settings_model`.
+
+    Resolved once per class (see `__init_subclass__`) instead of on every
+    backend construction.
+    """
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._settings_validator = cls._settings_model.__pydantic_validator__
+
     def __init__(
         self,
-        settings: BackendSettings | dict[str, Any] | None = None,
+        settings: BackendSettings | dict[str, Any] | str | bytes | None = None,
     ) -> None:
         if isinstance(settings, dict):
-            settings = self._settings_model(**settings)
-
-        self._settings = settings or self._settings_model()
+            validated_settings: BackendSettings = (
+                self._settings_validator.validate_python(settings)
+            )
+        elif isinstance(settings, (str, bytes)):
+            # Raw JSON settings - validate directly, without an intermediate dict
+            validated_settings = self._settings_validator.validate_json(settings)
+        else:
+            validated_settings = settings or self._settings_model()
+
+        self._settings = validated_settings
         self._is_closed: bool = False
 
         self._initialize()
@@ -83,32 +116,79 @@ class Backend(ABC):
             self.close()
 
     def __iter__(self) -> Iterator[dict[str, Any]]:
+        """Iterate over all entities in the backend.
+
+        The entities should be yielded lazily (e.g., from a server-side cursor),
+        not materialized as a list.
+        """
         return iter(self.search())
 
     def __len__(self) -> int:
         return self.count()
 
     # Container protocol methods
-    def __contains__(self, item: Any) -> bool:
-        if isinstance(item, dict):
-            # Convert to Entity
+    def _contains_dict(self, item: dict[str, Any]) -> bool:
+        """Check whether the entity given as a dict exists in the backend."""
+        # Membership only needs the entity's identity - extract the URI directly
+        # from the dict, avoiding a full validation pass where possible.
+        uri = item.get("uri", item.get("identity"))
+
+        if uri is None:
+            try:
+                uri = f"{item['namespace']}/{item['version']}/{item['name']}"
+            except KeyError:
+                uri = None
+
+        if uri is None:
+            # No identity can be derived - fall back to full validation
             item_or_errors = soft_entity(return_errors=True, **item)
             if isinstance(item_or_errors, list):
                 LOGGER.error(
-                    "item given to __contains__ is malformed, not a SOFT entity.\n"
-                    "Item: %r\nErrors: %s",
+                    "item given to __contains__ is malformed, not a SOFT entity."
+                    "\nItem: %r\nErrors: %s",
                     item,
                     item_or_errors,
                 )
                 return False
-            item = item_or_errors
 
-        if isinstance(item, str):
-            # Expect it to be a URI - let the backend handle validation
-            return self.read(item) is not None
+            return self.exists(get_uri(item_or_errors))
+
+        try:
+            return self.exists(str(uri))
+        except ValueError:
+            # The derived URI is invalid - the item is not a SOFT entity
+            LOGGER.error("item given to __contains__ has a malformed URI: %r", uri)
+            return False
+
+    def _contains_str(self, item: str) -> bool:
+        """Check whether the entity given as a URI exists in the backend."""
+        # Let the backend handle validation of the URI
+        return self.exists(item)
+
+    _CONTAINS_DISPATCH: ClassVar[dict[type, Callable[[Backend, Any], bool]]] = {
+        dict: _contains_dict,
+        str: _contains_str,
+    }
+    """Exact-type dispatch table for `__contains__`.
+
+    A single dict lookup replaces chained isinstance checks for the common item
+    types.
+    """
+
+    def __contains__(self, item: Any) -> bool:
+        if (handler := self._CONTAINS_DISPATCH.get(type(item))) is not None:
+            return handler(self, item)
 
         if isinstance(item, EntityType):
-            return self.read(get_uri(item)) is not None
+            return self.exists(get_uri(item))
+
+        # Subclasses of the dispatched types miss the exact-type lookup above -
+        # fall back to isinstance checks for them
+        if isinstance(item, dict):
+            return self._contains_dict(item)
+
+        if isinstance(item, str):
+            return self._contains_str(item)
 
         return False
 
@@ -133,6 +213,23 @@ class Backend(ABC):
         """Read an entity from the backend."""
         raise NotImplementedError
 
+    def exists(self, entity_identity: AnyHttpUrl | str) -> bool:
+        """Check whether an entity exists in the backend.
+
+        Backends may override this with a cheaper existence check than reading
+        the full entity.
+        """
+        return self.read(entity_identity) is not None
+
+    def iter_identities(self) -> Iterator[dict[str, Any]]:
+        """Iterate over the identity fields (uri, namespace, version, and name) of
+        all entities in the backend.
+
+        Backends may override this to only transfer the identity fields, rather
+        than the full entities.
+        """
+        return iter(self.search())
+
     @abstractmethod
     def update(
         self,
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+import contextlib
 import logging
 from pathlib import Path
 from typing import TYPE_CHECKING, Annotated, Literal
 
-from pydantic import Field, SecretStr, model_validator
+from pydantic import Field, SecretStr, ValidationError, model_validator
 from pydantic.functional_validators import AfterValidator
 from pymongo.errors import (
     BulkWriteError,
@@ -20,6 +21,7 @@ from pymongo.errors import (
 from entities_service.models import URI_REGEX, EntityType, soft_entity
 from entities_service.service.backend import Backends
 from entities_service.service.backend.backend import (
+    ENTITIES_ADAPTER,
     Backend,
     BackendError,
     BackendSettings,
@@ -264,6 +266,8 @@ def get_client(
 class MongoDBBackend(Backend):
     """Backend implementation for MongoDB."""
 
+    __slots__ = ("_collection",)
+
     _settings_model: type[MongoDBSettings] = MongoDBSettings
     _settings: MongoDBSettings
 
@@ -336,9 +340,19 @@ class MongoDBBackend(Backend):
         """Create one or more entities in the MongoDB."""
         LOGGER.info("Creating entities: %s", entities)
 
+        if entities and all(isinstance(entity, dict) for entity in entities):
+            # Validate the whole batch in a single pydantic-core call, amortizing
+            # the validator lookup across the batch. On failure, fall through with
+            # the dicts untouched and let _prepare_entity below validate per
+            # entity, reporting which entity is invalid.
+            with contextlib.suppress(ValidationError):
+                entities = ENTITIES_ADAPTER.validate_python(entities)
+
         entities = [self._prepare_entity(entity) for entity in entities]
 
-        result = self._collection.insert_many(entities)
+        # Use an unordered insert - the documents are independent, so the server may
+        # write them in parallel.
+        result = self._collection.insert_many(entities, ordered=False)
         if len(result.inserted_ids) > 1:
             return list(
                 self._collection.find(
@@ -355,6 +369,14 @@ class MongoDBBackend(Backend):
         filter = self._single_uri_query(str(entity_identity))
         return self._collection.find_one(filter, projection={"_id": False})
 
+    def exists(self, entity_identity: AnyHttpUrl | str) -> bool:
+        """Check whether an entity exists in the MongoDB.
+
+        Only the `_id` field is projected - no entity document is transferred.
+        """
+        filter = self._single_uri_query(str(entity_identity))
+        return self._collection.find_one(filter, projection={"_id": True}) is not None
+
     def update(
         self,
         entity_identity: AnyHttpUrl | str,
@@ -370,6 +392,23 @@ class MongoDBBackend(Backend):
         filter = self._single_uri_query(str(entity_identity))
         self._collection.delete_one(filter)
 
+    def iter_identities(self) -> Iterator[dict[str, Any]]:
+        """Iterate over the identity fields of all entities in the MongoDB.
+
+        Only the identity fields are projected - the BSON decode cost per
+        document does not scale with the entity size.
+        """
+        return self._collection.find(
+            {},
+            projection={
+                "uri": True,
+                "namespace": True,
+                "version": True,
+                "name": True,
+                "_id": False,
+            },
+        )
+
     # Backend methods (search)
     def search(self, query: Any = None) -> Iterator[dict[str, Any]]:
         """Search for entities."""
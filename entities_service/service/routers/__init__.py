@@ -2,18 +2,25 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from importlib import import_module
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:  # pragma: no cover
-    from collections.abc import Generator
-
     from fastapi import APIRouter
 
 
-def get_routers() -> Generator[APIRouter]:
-    """Get the routers."""
+@lru_cache(maxsize=1)
+def get_routers() -> tuple[APIRouter, ...]:
+    """Get the routers.
+
+    The directory scan and module imports only need to happen once per process -
+    the discovered routers are cached (and returned as a tuple, so repeated
+    calls can re-iterate them).
+    """
+    routers: list[APIRouter] = []
+
     this_dir = Path(__file__).parent.resolve()
 
     for path in this_dir.glob("*.py"):
@@ -25,4 +32,6 @@ def get_routers() -> Generator[APIRouter]:
         if not hasattr(module, "ROUTER"):
             raise RuntimeError(f"Module {module.__name__} has no ROUTER")
 
-        yield module.ROUTER
+        routers.append(module.ROUTER)
+
+    return tuple(routers)
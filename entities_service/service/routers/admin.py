@@ -17,7 +17,7 @@ from entities_service.models import URI_REGEX, Entity, get_uri
 from entities_service.service.backend import get_backend
 from entities_service.service.config import CONFIG
 from entities_service.service.security import verify_token
-from entities_service.service.utils import _add_dimensions
+from entities_service.service.utils import _add_dimensions, _invalidate_entity_cache
 
 if TYPE_CHECKING:  # pragma: no cover
     from typing import Any
@@ -56,23 +56,30 @@ async def create_entities(
     else:
         entities = [entities]
 
-    write_fail_exception = HTTPException(
-        status_code=status.HTTP_502_BAD_GATEWAY,
-        detail=(
-            "Could not create entit{suffix_entit} with uri{suffix_uri}: {uris}".format(
-                suffix_entit="y" if len(entities) == 1 else "ies",
-                suffix_uri="" if len(entities) == 1 else "s",
-                uris=", ".join(get_uri(entity) for entity in entities),
-            )
-        ),
-    )
+    # Resolve each entity's URI once - it is needed for the namespace grouping and
+    # (possibly) the error message below.
+    entity_uris = [get_uri(entity) for entity in entities]
+
+    def write_fail_exception() -> HTTPException:
+        """Build the exception for a failed write, only when it is to be raised."""
+        return HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail=(
+                "Could not create entit{suffix_entit} with uri{suffix_uri}: "
+                "{uris}".format(
+                    suffix_entit="y" if len(entities) == 1 else "ies",
+                    suffix_uri="" if len(entities) == 1 else "s",
+                    uris=", ".join(entity_uris),
+                )
+            ),
+        )
 
     # Determine backends needed
     namespace_entities_mapping: dict[str | None, list[Entity]] = defaultdict(list)
 
-    for entity in entities:
-        if (match := URI_REGEX.match(get_uri(entity))) is None:
-            raise write_fail_exception
+    for entity, entity_uri in zip(entities, entity_uris, strict=True):
+        if (match := URI_REGEX.match(entity_uri)) is None:
+            raise write_fail_exception()
 
         namespace_entities_mapping[match.group("specific_namespace")].append(entity)
 
@@ -114,7 +121,7 @@ async def create_entities(
                     ),
                 )
             LOGGER.exception(err)
-            raise write_fail_exception from err
+            raise write_fail_exception() from err
 
         if (
             created_namespaced_entities is None
@@ -127,7 +134,11 @@ async def create_entities(
                 and not isinstance(created_namespaced_entities, list)
             )
         ):
-            raise write_fail_exception
+            raise write_fail_exception()
+
+        # Drop any cached reads of the (re-)created entities
+        for created_entity in namespaced_entities:
+            _invalidate_entity_cache(get_uri(created_entity))
 
         # Ensure the returned entities have the dimensions key
         await _add_dimensions(created_namespaced_entities)
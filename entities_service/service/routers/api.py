@@ -5,16 +5,18 @@ This router is used for more introspective service endpoints.
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Annotated, Any
+from typing import Annotated
 
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from pydantic import AnyHttpUrl, ValidationError
 
-from entities_service.models import URI_REGEX, Entity, EntityNamespaceType
+from entities_service.models import BASE_URL, URI_REGEX, Entity, EntityNamespaceType
 from entities_service.service.backend import get_backend, get_dbs
 from entities_service.service.config import CONFIG
-from entities_service.service.utils import _get_entities
+from entities_service.service.utils import _dump_entity, _get_entities
 
 LOGGER = logging.getLogger(__name__)
 
@@ -23,9 +25,7 @@ ROUTER = APIRouter(prefix="/_api", tags=["API"])
 
 @ROUTER.get(
     "/entities",
-    response_model=list[Entity],
-    response_model_by_alias=True,
-    response_model_exclude_unset=True,
+    responses={200: {"model": list[Entity]}},
 )
 async def list_entities(
     namespaces: Annotated[
@@ -38,7 +38,7 @@ async def list_entities(
             ),
         ),
     ] = []  # noqa: B006
-) -> list[dict[str, Any]]:
+) -> ORJSONResponse:
     """List all entities in the given namespace(s)."""
     # Format namespaces
     parsed_namespaces: set[str | None] = set()
@@ -58,7 +58,7 @@ async def list_entities(
 
         if is_url:
             # Ensure the namespace is within the base URL domain
-            if not namespace.startswith(str(CONFIG.base_url).rstrip("/")):
+            if not namespace.startswith(BASE_URL):
                 LOGGER.error(
                     "Namespace %r does not start with the base URL %s.",
                     namespace,
@@ -80,7 +80,7 @@ async def list_entities(
             else:
                 LOGGER.debug("Namespace %r is a 'regular' full namespace.", namespace)
 
-                specific_namespace = namespace[len(str(CONFIG.base_url).rstrip("/")) :]
+                specific_namespace = namespace[len(BASE_URL) :]
                 if specific_namespace.strip() in ("", "/"):
                     specific_namespace = None
                 else:
@@ -110,22 +110,21 @@ async def list_entities(
 
     LOGGER.debug("Parsed namespaces: %r", parsed_namespaces)
 
-    # Retrieve entities
+    # Retrieve entities from the databases concurrently
     entities = []
-    for namespace in parsed_namespaces:
-        # Retrieve entities from the database
-        entities.extend(await _get_entities(namespace))
+    for namespaced_entities in await asyncio.gather(
+        *(_get_entities(namespace) for namespace in parsed_namespaces)
+    ):
+        entities.extend(namespaced_entities)
 
-    return entities
+    return ORJSONResponse([_dump_entity(entity) for entity in entities])
 
 
 @ROUTER.get(
     "/namespaces",
-    response_model=list[EntityNamespaceType],
-    response_model_by_alias=True,
-    response_model_exclude_unset=True,
+    responses={200: {"model": list[EntityNamespaceType]}},
 )
-async def list_namespaces() -> list[str]:
+async def list_namespaces() -> ORJSONResponse:
     """List all entities' namespaces.
 
     This endpoint will return a list of all namespaces from existing entities in the
@@ -157,13 +156,14 @@ async def list_namespaces() -> list[str]:
     for db in get_dbs():
         backend = get_backend(CONFIG.backend, auth_level="read", db=db)
 
+        # Retrieve the first entity's identity from the database - a single,
+        # projected query also establishes whether the backend is empty.
+        entity = next(iter(backend.iter_identities()), None)
+
         # Ignore empty backends
-        if not len(backend):
+        if entity is None:
             continue
 
-        # Retrieve the first entity from the database
-        entity = next(iter(backend))
-
         if "namespace" in entity:
             namespaces.append(entity["namespace"])
             LOGGER.debug(
@@ -195,4 +195,4 @@ async def list_namespaces() -> list[str]:
             detail="No namespaces found in the backend.",
         )
 
-    return namespaces
+    return ORJSONResponse(namespaces)
@@ -2,15 +2,72 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
+from collections import OrderedDict
 from typing import TYPE_CHECKING
 
+import orjson
+
+from entities_service.models import BASE_URL, soft_entity
 from entities_service.service.backend import get_backend
+from entities_service.service.backend.backend import EntityNotFound
 from entities_service.service.config import CONFIG
 
 if TYPE_CHECKING:  # pragma: no cover
     from typing import Any
 
 
+_ENTITY_CACHE: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+"""In-process cache of entity responses, keyed by URI.
+
+Entities are immutable per version, so repeat reads of the same URI can skip
+both the backend round-trip and the validation/serialization stage entirely.
+Entries map the URI to an insertion timestamp and the fully encoded JSON
+response body. The cache is bounded (least-recently-used eviction) and entries
+expire after a TTL, with explicit invalidation on (re-)creation.
+"""
+
+_ENTITY_CACHE_MAX_SIZE = 10_000
+"""The maximum number of entities kept in the entity cache."""
+
+_ENTITY_CACHE_TTL = 300
+"""The time-to-live (in seconds) for entries in the entity cache."""
+
+
+def _entity_cache_get(uri: str) -> bytes | None:
+    """Return the cached entity response body for `uri`, or `None` on a miss or
+    expired entry."""
+    if (cached := _ENTITY_CACHE.get(uri)) is None:
+        return None
+
+    timestamp, content = cached
+
+    if time.monotonic() - timestamp > _ENTITY_CACHE_TTL:
+        _ENTITY_CACHE.pop(uri, None)
+        return None
+
+    # Mark the entry as recently used
+    _ENTITY_CACHE.move_to_end(uri)
+
+    return content
+
+
+def _entity_cache_set(uri: str, content: bytes) -> None:
+    """Cache the entity response body `content` under `uri`, evicting
+    least-recently-used entries if full."""
+    _ENTITY_CACHE[uri] = (time.monotonic(), content)
+    _ENTITY_CACHE.move_to_end(uri)
+
+    while len(_ENTITY_CACHE) > _ENTITY_CACHE_MAX_SIZE:
+        _ENTITY_CACHE.popitem(last=False)
+
+
+def _invalidate_entity_cache(uri: str) -> None:
+    """Drop the cached entity response for `uri` (if any), e.g. after a write."""
+    _ENTITY_CACHE.pop(uri, None)
+
+
 async def _add_dimensions(entity: dict[str, Any] | list[dict[str, Any]]) -> None:
     """Utility function for the endpoints to add dimensions to an entity."""
     if isinstance(entity, list):
@@ -31,29 +88,59 @@ async def _add_dimensions(entity: dict[str, Any] | list[dict[str, Any]]) -> None
             raise ValueError(f"Invalid entity: uri={entity['uri']}")
 
 
-async def _get_entity(version: str, name: str, db: str | None = None) -> dict[str, Any]:
-    """Utility function for the endpoints to retrieve an entity."""
-    uri = f"{str(CONFIG.base_url).rstrip('/')}"
+def _dump_entity(entity: dict[str, Any]) -> dict[str, Any]:
+    """Validate and dump an entity (as returned by the backend) for a response.
+
+    The dump matches what FastAPI's response_model machinery would produce
+    (aliases, unset-field exclusion) - but in a single pass, without running the
+    dict through jsonable_encoder and a second outbound validation.
+    """
+    entity_model = soft_entity(
+        error_msg=f"Invalid entity: uri={entity.get('uri', entity.get('identity'))}",
+        **entity,
+    )
+
+    return entity_model.model_dump(mode="json", by_alias=True, exclude_unset=True)
 
-    if db:
-        uri += f"/{db}"
 
-    uri += f"/{version}/{name}"
+async def _get_entity(version: str, name: str, db: str | None = None) -> bytes:
+    """Utility function for the endpoints to retrieve an entity.
 
-    entity = get_backend(CONFIG.backend, auth_level="read", db=db).read(uri)
+    The entity is returned as an encoded JSON response body, ready to be
+    streamed to the client - cache hits bypass the backend round-trip as well
+    as the validation and serialization stages.
+    """
+    uri = f"{BASE_URL}/{db}/{version}/{name}" if db else f"{BASE_URL}/{version}/{name}"
+
+    if (cached := _entity_cache_get(uri)) is not None:
+        return cached
+
+    backend = get_backend(CONFIG.backend, auth_level="read", db=db)
+
+    # Reading from the backend is blocking I/O - run it in a thread, keeping the
+    # event loop free to serve other requests during the round-trip.
+    entity = await asyncio.to_thread(backend.read, uri)
 
     if entity is None:
-        raise ValueError(f"Could not find entity: uri={uri}")
+        raise EntityNotFound(f"Could not find entity: uri={uri}")
 
     await _add_dimensions(entity)
 
-    return entity
+    content = orjson.dumps(_dump_entity(entity))
+
+    _entity_cache_set(uri, content)
+
+    return content
 
 
 async def _get_entities(db: str | None) -> list[dict[str, Any]]:
     """Utility function for the endpoints to retrieve all endpoints from the
     namespace/db-specific backend."""
-    entities = list(get_backend(CONFIG.backend, auth_level="read", db=db))
+    backend = get_backend(CONFIG.backend, auth_level="read", db=db)
+
+    # Listing the backend is blocking I/O - run it in a thread, so that concurrent
+    # calls (e.g., listing entities for several namespaces) can overlap.
+    entities = await asyncio.to_thread(list, backend)
 
     await _add_dimensions(entities)
 
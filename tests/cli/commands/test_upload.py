@@ -127,6 +127,67 @@ def test_upload_filepath(
     ), CLI_RESULT_FAIL_MESSAGE.format(stdout=result.stdout, stderr=result.stderr)
 
 
+@pytest.mark.usefixtures("_empty_backend_collection", "_mock_successful_oauth_response")
+def test_upload_json_output_format(
+    cli: CliRunner,
+    static_dir: Path,
+    httpx_mock: HTTPXMock,
+    token_mock: str,
+) -> None:
+    """Test upload with '--output-format=json' emits a parsable JSON summary."""
+    import json
+
+    from entities_service.cli import main
+    from entities_service.service.config import CONFIG
+
+    entity_filepath = static_dir / "valid_entities" / "Person.json"
+    raw_entity: dict[str, Any] = json.loads(entity_filepath.read_bytes())
+
+    core_namespace = str(CONFIG.base_url).rstrip("/")
+
+    id_key = "uri" if "uri" in raw_entity else "identity"
+    assert id_key in raw_entity
+
+    # Match raw_entity to a backend entity (always use 'uri')
+    raw_entity["uri"] = raw_entity.pop(id_key)
+
+    # Mock a good login check
+    httpx_mock.add_response(
+        url=f"{core_namespace}/_admin/create",
+        status_code=204,
+        match_json=[],
+    )
+
+    # Mock response for "Check if entity already exists"
+    httpx_mock.add_response(
+        url=raw_entity["uri"],
+        status_code=404,  # not found
+    )
+
+    # Mock response for "Upload entities"
+    httpx_mock.add_response(
+        url=f"{core_namespace}/_admin/create",
+        method="POST",
+        match_headers={"Authorization": f"Bearer {token_mock}"},
+        match_json=[raw_entity],
+        status_code=201,  # created
+    )
+
+    result = cli.invoke(
+        main.APP, f"upload --output-format=json --quiet {entity_filepath}"
+    )
+
+    assert result.exit_code == 0, CLI_RESULT_FAIL_MESSAGE.format(
+        stdout=result.stdout, stderr=result.stderr
+    )
+
+    summary = json.loads(result.stdout)
+    assert summary == {
+        "uploaded": 1,
+        "uris": [raw_entity["uri"]],
+    }, CLI_RESULT_FAIL_MESSAGE.format(stdout=result.stdout, stderr=result.stderr)
+
+
 @pytest.mark.usefixtures("_mock_successful_oauth_response")
 def test_upload_filepath_invalid_format(
     cli: CliRunner, tmp_path: Path, httpx_mock: HTTPXMock
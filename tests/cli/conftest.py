@@ -43,17 +43,31 @@ def tmp_cache_file(tmp_cache_dir: Path) -> Path:
     return tmp_cache_dir / "oauth2_token_cache.json"
 
 
+@pytest.fixture(scope="session")
+def _session_token_cache(tmp_path_factory: pytest.TempPathFactory):
+    """A single token cache object, shared across the whole CLI test session.
+
+    The cache's backing file path is re-pointed (and the cache cleared) per test
+    function, avoiding re-constructing the cache object for every test.
+    """
+    from httpx_auth import JsonTokenFileCache
+
+    return JsonTokenFileCache(
+        str(tmp_path_factory.mktemp("cli_cache") / "oauth2_token_cache.json")
+    )
+
+
 @pytest.fixture(autouse=True)
 def _function_specific_cli_cache_dir(
-    tmp_cache_file: Path, monkeypatch: pytest.MonkeyPatch
+    _session_token_cache, tmp_cache_file: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
     """Set the CLI cache directory to a temporary one."""
-    from httpx_auth import JsonTokenFileCache
-
-    cache = JsonTokenFileCache(str(tmp_cache_file))
+    _session_token_cache._tokens_path = tmp_cache_file
+    _session_token_cache.clear()
 
     monkeypatch.setattr(
-        "entities_service.cli._utils.generics.OAuth2.token_cache", cache
+        "entities_service.cli._utils.generics.OAuth2.token_cache",
+        _session_token_cache,
     )
 
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import cache
 from typing import TYPE_CHECKING, NamedTuple
 
 import pytest
@@ -74,6 +75,29 @@ class ParameterizeGetEntities(NamedTuple):
     backend_entity: dict[str, Any]
 
 
+def load_yaml(path: Path) -> Any:
+    """Load a YAML file, using the C-accelerated loader if available."""
+    import yaml
+
+    return yaml.load(
+        path.read_bytes(), Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    )
+
+
+@cache
+def load_valid_entities() -> tuple[dict[str, Any], ...]:
+    """Load the valid test entities, parsing the YAML file only once per session.
+
+    The returned entities are shared - callers that mutate them must deepcopy them
+    first.
+    """
+    from pathlib import Path
+
+    static_dir = (Path(__file__).parent / "static").resolve()
+
+    return tuple(load_yaml(static_dir / "valid_entities.yaml"))
+
+
 ## Pytest configuration functions and hooks ##
 
 
@@ -223,14 +247,10 @@ def pytest_sessionstart(session: pytest.Session) -> None:
     import shutil
     from pathlib import Path
 
-    import yaml
-
     # Unpack `valid_entities.yaml` to `valid_entities/*.json`
     static_dir = (Path(__file__).parent / "static").resolve()
 
-    entities: list[dict[str, Any]] = yaml.safe_load(
-        (static_dir / "valid_entities.yaml").read_text()
-    )
+    entities: tuple[dict[str, Any], ...] = load_valid_entities()
 
     valid_entities_dir = static_dir / "valid_entities"
     if valid_entities_dir.exists():
@@ -340,28 +360,29 @@ def pytest_sessionfinish(
         )
 
 
-def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
-    """Return a parameterized entity."""
-    if "parameterized_entity" not in metafunc.fixturenames:
-        return
+@cache
+def parameterized_entities() -> tuple[ParameterizeGetEntities, ...]:
+    """Build the parameterized entities, once per session.
 
+    The returned entities are shared - pytest_generate_tests deepcopies them per
+    test, since tests may mutate the entity dicts.
+    """
     import re
     from copy import deepcopy
-    from pathlib import Path
-
-    import yaml
 
     from entities_service.service.config import CONFIG
 
+    # namespace = "http://onto-ns.com/meta"
+    namespace = str(CONFIG.base_url).rstrip("/")
+
+    # Compile the URI regex once, instead of once per entity
+    uri_regex = re.compile(
+        rf"^{re.escape(namespace)}/(?P<version>[^/]+)/(?P<name>[^/]+)$"
+    )
+
     def get_uri_parts(uri: str) -> tuple[str, str]:
         """Return the version and name part of a uri."""
-        # namespace = "http://onto-ns.com/meta"
-        namespace = str(CONFIG.base_url).rstrip("/")
-
-        match = re.match(
-            rf"^{re.escape(namespace)}/(?P<version>[^/]+)/(?P<name>[^/]+)$",
-            uri,
-        )
+        match = uri_regex.match(uri)
         assert match is not None, (
             f"Could not retrieve version and name from {uri!r}. "
             "URI must be of the form: "
@@ -380,21 +401,18 @@ def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
         version = entity.get("version")
         name = entity.get("name")
 
-        assert not any(
-            _ is None for _ in (namespace, version, name)
-        ), "Could not retrieve namespace, version, and/or name from test entities."
+        error_message = (
+            "Could not retrieve namespace, version, and/or name from test entities."
+        )
+        assert namespace is not None, error_message
+        assert version is not None, error_message
+        assert name is not None, error_message
 
         return f"{namespace}/{version}/{name}"
 
     results: list[ParameterizeGetEntities] = []
 
-    static_dir = (Path(__file__).parent / "static").resolve()
-
-    entities: list[dict[str, Any]] = yaml.safe_load(
-        (static_dir / "valid_entities.yaml").read_text()
-    )
-
-    for entity in entities:
+    for entity in load_valid_entities():
         uri = entity.get("uri", entity.get("identity")) or get_uri(entity)
 
         version, name = get_uri_parts(uri)
@@ -432,6 +450,20 @@ def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
             ParameterizeGetEntities(entity, version, name, uri, backend_entity)
         )
 
+    return tuple(results)
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    """Return a parameterized entity."""
+    if "parameterized_entity" not in metafunc.fixturenames:
+        return
+
+    from copy import deepcopy
+
+    # Deepcopy the cached results - the parameterized entities may be mutated by
+    # the tests using them.
+    results = [deepcopy(result) for result in parameterized_entities()]
+
     metafunc.parametrize(
         "parameterized_entity",
         results,
@@ -583,23 +615,24 @@ def namespace(
 @pytest.fixture(autouse=True)
 def _reset_mongo_test_collections(
     get_backend_user: GetBackendUserFixture,
-    static_dir: Path,
     existing_specific_namespace: str,
 ) -> None:
     """Reset the MongoDB test collections, dropping them and re-filling them with test
     entities."""
     from copy import deepcopy
 
-    import yaml
-
     from entities_service.service.backend import get_backend
     from entities_service.service.config import CONFIG
+    from entities_service.service.utils import _ENTITY_CACHE
 
-    # First, prepare the test data
+    # Reset the service's in-process entity cache along with the collections
+    _ENTITY_CACHE.clear()
 
-    entities: list[dict[str, Any]] = yaml.safe_load(
-        (static_dir / "valid_entities.yaml").read_text()
-    )
+    # First, prepare the test data
+    # Deepcopy the cached entities, since they are mutated below.
+    entities: list[dict[str, Any]] = [
+        deepcopy(entity) for entity in load_valid_entities()
+    ]
     for entity in entities:
         ## Convert all '$ref' to 'ref' in the valid_entities.yaml file
         # SOFT5
@@ -654,8 +687,11 @@ def _reset_mongo_test_collections(
             db=namespace,
         )
         backend._collection.drop()
+        # Use an unordered insert - the documents are independent, so the server may
+        # write them in parallel.
         backend._collection.insert_many(
-            entities if namespace is None else specific_namespaced_entities
+            entities if namespace is None else specific_namespaced_entities,
+            ordered=False,
         )
 
 
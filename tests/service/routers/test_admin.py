@@ -532,3 +532,75 @@ def test_create_entity_in_new_namespace(
     current_collections = new_backend._collection.database.list_collection_names()
     assert backend_namespace in current_collections
     assert namespace not in current_collections
+
+
+def test_create_invalidates_cached_entity(
+    client: ClientFixture,
+    parameterized_entity: ParameterizeGetEntities,
+    mock_auth_verification: MockAuthVerification,
+    auth_header: dict[Literal["Authorization"], str],
+    get_backend_user: GetBackendUserFixture,
+) -> None:
+    """Test that (re-)creating an entity drops its cached GET response.
+
+    A GET populates the in-process entity cache - without the invalidation in the
+    create endpoint, a subsequent GET would serve the stale, pre-create response.
+    """
+    from copy import deepcopy
+
+    from entities_service.service.backend import get_backend
+    from entities_service.service.utils import _ENTITY_CACHE
+
+    # Setup mock responses for OAuth2 verification
+    mock_auth_verification(auth_role="write")
+
+    url_path = f"/{parameterized_entity.version}/{parameterized_entity.name}"
+
+    # Retrieve the entity, populating the cache
+    with client() as client_:
+        response = client_.get(url_path, timeout=5)
+
+    assert response.status_code == 200, response.json()
+    assert parameterized_entity.uri in _ENTITY_CACHE
+
+    # Remove the current backend document before re-creating it - mongomock does
+    # not enforce the unique URI index, so re-creation would otherwise leave a
+    # duplicate document behind.
+    backend_user = get_backend_user("write")
+    backend = get_backend(
+        auth_level="write",
+        settings={
+            "mongo_username": backend_user["username"],
+            "mongo_password": backend_user["password"],
+        },
+    )
+    backend.delete(parameterized_entity.uri)
+
+    # The cache still serves the (now deleted) entity
+    with client() as client_:
+        response = client_.get(url_path, timeout=5)
+
+    assert response.status_code == 200, response.json()
+
+    # Re-create the entity with a changed description
+    changed_entity = deepcopy(parameterized_entity.entity)
+    changed_entity["description"] = "Changed description."
+
+    with client(auth_role="write") as client_:
+        response = client_.post(
+            "/_admin/create",
+            json=changed_entity,
+            headers=auth_header,
+        )
+
+    assert response.status_code == 201, response.json()
+    assert parameterized_entity.uri not in _ENTITY_CACHE
+
+    # A new GET must serve the re-created entity, not the stale cached response
+    with client() as client_:
+        response = client_.get(url_path, timeout=5)
+
+    response_json = response.json()
+
+    assert response.status_code == 200, response_json
+    assert response_json["description"] == "Changed description.", response_json
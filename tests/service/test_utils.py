@@ -50,3 +50,90 @@ async def test_get_entities(
 
     # Test with no entities
     assert await _get_entities(db) == entities
+
+
+def test_entity_cache_set_and_get() -> None:
+    """Test the _entity_cache_set/_entity_cache_get round-trip."""
+    from entities_service.service.utils import (
+        _ENTITY_CACHE,
+        _entity_cache_get,
+        _entity_cache_set,
+    )
+
+    uri = "http://onto-ns.com/meta/1.0/CacheTest"
+    other_uri = "http://onto-ns.com/meta/1.0/OtherCacheTest"
+    content = b'{"uri": "http://onto-ns.com/meta/1.0/CacheTest"}'
+
+    # A URI that has never been cached is a miss
+    assert _entity_cache_get(uri) is None
+
+    _entity_cache_set(uri, content)
+    assert _entity_cache_get(uri) == content
+
+    # A hit marks the entry as most recently used
+    _entity_cache_set(other_uri, b"{}")
+    assert _entity_cache_get(uri) == content
+    assert next(reversed(_ENTITY_CACHE)) == uri
+
+
+def test_entity_cache_ttl_expiry() -> None:
+    """Test that _entity_cache_get drops entries older than the TTL."""
+    import time
+
+    from entities_service.service.utils import (
+        _ENTITY_CACHE,
+        _ENTITY_CACHE_TTL,
+        _entity_cache_get,
+    )
+
+    uri = "http://onto-ns.com/meta/1.0/CacheTest"
+
+    # Backdate the entry's timestamp to just beyond the TTL
+    _ENTITY_CACHE[uri] = (time.monotonic() - _ENTITY_CACHE_TTL - 1, b"{}")
+
+    assert _entity_cache_get(uri) is None
+
+    # The expired entry is dropped eagerly, not left to eviction
+    assert uri not in _ENTITY_CACHE
+
+
+def test_entity_cache_lru_eviction(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that _entity_cache_set evicts the least-recently-used entries."""
+    from entities_service.service import utils
+
+    monkeypatch.setattr(utils, "_ENTITY_CACHE_MAX_SIZE", 3)
+
+    uris = [f"http://onto-ns.com/meta/1.0/CacheTest{_}" for _ in range(4)]
+
+    for uri in uris[:3]:
+        utils._entity_cache_set(uri, b"{}")
+
+    # Touch the oldest entry, making it the most recently used
+    assert utils._entity_cache_get(uris[0]) == b"{}"
+
+    # Inserting a fourth entry must evict the least recently used one - which is
+    # now uris[1], not the first-inserted uris[0]
+    utils._entity_cache_set(uris[3], b"{}")
+
+    assert len(utils._ENTITY_CACHE) == 3
+    assert uris[1] not in utils._ENTITY_CACHE
+    assert all(uri in utils._ENTITY_CACHE for uri in (uris[0], uris[2], uris[3]))
+
+
+def test_invalidate_entity_cache() -> None:
+    """Test that _invalidate_entity_cache drops the entry for a URI."""
+    from entities_service.service.utils import (
+        _ENTITY_CACHE,
+        _entity_cache_set,
+        _invalidate_entity_cache,
+    )
+
+    uri = "http://onto-ns.com/meta/1.0/CacheTest"
+
+    _entity_cache_set(uri, b"{}")
+    _invalidate_entity_cache(uri)
+
+    assert uri not in _ENTITY_CACHE
+
+    # Invalidating a URI that is not cached is a no-op
+    _invalidate_entity_cache(uri)